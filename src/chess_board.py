@@ -1,13 +1,32 @@
 import math
 from enum import IntEnum
-from copy import deepcopy
-from PySide6.QtCore import (Qt, QObject, QPoint, QPointF, QRect, QRectF, QTimeLine, Signal)
-from PySide6.QtWidgets import (QGraphicsScene, QGraphicsView, QGraphicsPixmapItem, QGraphicsItemAnimation, QLabel)
+from PySide6.QtCore import (Qt, QObject, QPoint, QRect, QRectF, Signal,
+                            QPropertyAnimation, QParallelAnimationGroup, QEasingCurve)
+from PySide6.QtWidgets import (QGraphicsScene, QGraphicsView, QGraphicsPixmapItem, QLabel)
 
 from image import ChessImage
-from .chess_piece import ChessPiece, PieceType, MoveType, PieceMove
+from .chess_piece import (ChessPiece, PieceType, MoveType, PieceMove,
+                          getPieceColor, getPieceKind, isEmpty, isMyPiece, isOpponentPiece,
+                          RANK_CHARS, FILE_CHARS)
 from .promotion import PromotionItem
 
+# Print debug messages (board status, available moves, ...) on the console
+DEBUG = False
+
+# Initial board status : A row of bytes (piece type) per rank, from rank 1 to rank 8
+INITIAL_BOARD = (
+    bytes((PieceType.WHITE_ROOK, PieceType.WHITE_KNIGHT, PieceType.WHITE_BISHOP, PieceType.WHITE_QUEEN,
+           PieceType.WHITE_KING, PieceType.WHITE_BISHOP, PieceType.WHITE_KNIGHT, PieceType.WHITE_ROOK)),
+    bytes((PieceType.WHITE_PAWN,) * 8),
+    bytes((PieceType.EMPTY,) * 8),
+    bytes((PieceType.EMPTY,) * 8),
+    bytes((PieceType.EMPTY,) * 8),
+    bytes((PieceType.EMPTY,) * 8),
+    bytes((PieceType.BLACK_PAWN,) * 8),
+    bytes((PieceType.BLACK_ROOK, PieceType.BLACK_KNIGHT, PieceType.BLACK_BISHOP, PieceType.BLACK_QUEEN,
+           PieceType.BLACK_KING, PieceType.BLACK_BISHOP, PieceType.BLACK_KNIGHT, PieceType.BLACK_ROOK))
+)
+
 class MoveDir(IntEnum):
     UP        = 0
     DOWN      = 1
@@ -19,6 +38,56 @@ class MoveDir(IntEnum):
     RIGHTDOWN = 7
     KNIGHT    = 8
 
+# (Rank, File) step for each sliding direction
+MOVE_STEP = {
+    MoveDir.UP       : ( 1,  0), MoveDir.DOWN      : (-1,  0),
+    MoveDir.LEFT     : ( 0, -1), MoveDir.RIGHT     : ( 0,  1),
+    MoveDir.LEFTUP   : ( 1, -1), MoveDir.RIGHTUP   : ( 1,  1),
+    MoveDir.LEFTDOWN : (-1, -1), MoveDir.RIGHTDOWN : (-1,  1)
+}
+
+# (Rank, File) leaps of knight
+KNIGHT_LEAP = ((-2, 1), (-1, 2), (1, 2), (2, 1),
+               (2, -1), (1, -2), (-1, -2), (-2, -1))
+
+def _squares_on_ray(rank : int, file : int, rank_step : int, file_step : int) -> tuple[tuple[int, int], ...]:
+    _squares = []
+    _rank, _file = rank + rank_step, file + file_step
+    while 0 <= _rank < 8 and 0 <= _file < 8:
+        _squares.append((_rank, _file))
+        _rank += rank_step; _file += file_step
+    return tuple(_squares)
+
+# Lookup tables built once at import
+# RAY_TABLE[movedir][rank][file] : Squares on the path from (rank, file) toward 'movedir', nearest first
+RAY_TABLE = tuple(
+    tuple(tuple(_squares_on_ray(_rank, _file, *MOVE_STEP[_movedir]) for _file in range(8))
+          for _rank in range(8))
+    for _movedir in sorted(MOVE_STEP)
+)
+
+# KNIGHT_TABLE[rank][file] : Squares the knight on (rank, file) can leap to
+KNIGHT_TABLE = tuple(
+    tuple(tuple((_rank + _leap_rank, _file + _leap_file) for _leap_rank, _leap_file in KNIGHT_LEAP
+                if 0 <= _rank + _leap_rank < 8 and 0 <= _file + _leap_file < 8)
+          for _file in range(8))
+    for _rank in range(8)
+)
+
+# Board update kernel : Takes only the board and plain ints (no Qt / piece objects).
+# Moves 'piece' from old to new square; an auxiliary square (castling rook, en-passant victim)
+# is cleared if given, and filled with 'aux_piece' if a new auxiliary square is given.
+def _apply_move(board : list[bytearray],
+                old_rank : int, old_file : int, new_rank : int, new_file : int, piece : int,
+                aux_old_rank : int = -1, aux_old_file : int = -1,
+                aux_new_rank : int = -1, aux_new_file : int = -1, aux_piece : int = PieceType.EMPTY) -> None:
+    board[old_rank][old_file] = PieceType.EMPTY
+    board[new_rank][new_file] = piece
+    if aux_old_rank >= 0:
+        board[aux_old_rank][aux_old_file] = PieceType.EMPTY
+    if aux_new_rank >= 0:
+        board[aux_new_rank][aux_new_file] = aux_piece
+
 class ReverseBoardButton(QLabel):
     def __init__(self, resource : ChessImage,
                        parent : QObject | None):
@@ -44,6 +113,10 @@ class ChessBoardView(QGraphicsView):
         super().__init__(scene, parent)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+        # Repaint the whole (small, fixed-size) viewport instead of tracking dirty regions
+        # of every moving piece : A little more fill, but no per-frame region bookkeeping.
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
     
     boardClicked = Signal(QPoint)
     pieceClicked = Signal(ChessPiece)
@@ -62,11 +135,48 @@ class ChessBoardView(QGraphicsView):
             self.boardClicked.emit(__pos)
 
 class ChessBoard(QObject):
+    # Castling rights : One bit per (turn, side)
+    __CASTLING_RIGHT_BIT = {
+        (PieceType.WHITE, MoveType.CASTLING_K) : 0b0001,
+        (PieceType.WHITE, MoveType.CASTLING_Q) : 0b0010,
+        (PieceType.BLACK, MoveType.CASTLING_K) : 0b0100,
+        (PieceType.BLACK, MoveType.CASTLING_Q) : 0b1000
+    }
+
+    # Castling rights revoked when a piece leaves (or is captured on) the square
+    __CASTLING_RIGHT_MASK = {
+        (0, 4) : 0b0011, (0, 7) : 0b0001, (0, 0) : 0b0010,
+        (7, 4) : 0b1100, (7, 7) : 0b0100, (7, 0) : 0b1000
+    }
+
+    # Rays from king : (direction, opponent pieces attacking at any distance, attacking only if adjacent)
+    __KING_RAYS = {
+        PieceType.WHITE : (
+            (MoveDir.UP,        (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.DOWN,      (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.LEFT,      (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.RIGHT,     (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.LEFTUP,    (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING, PieceType.PAWN)),
+            (MoveDir.RIGHTUP,   (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING, PieceType.PAWN)),
+            (MoveDir.LEFTDOWN,  (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.RIGHTDOWN, (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING,))
+        ),
+        PieceType.BLACK : (
+            (MoveDir.UP,        (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.DOWN,      (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.LEFT,      (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.RIGHT,     (PieceType.ROOK,   PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.LEFTUP,    (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.RIGHTUP,   (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING,)),
+            (MoveDir.LEFTDOWN,  (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING, PieceType.PAWN)),
+            (MoveDir.RIGHTDOWN, (PieceType.BISHOP, PieceType.QUEEN), (PieceType.KING, PieceType.PAWN))
+        )
+    }
+
     def __init__(self, resource : ChessImage,
                        parent : QObject | None = None):
         
         super().__init__(parent)
-        self.debug_mode = True
 
         self.resource = resource
         self.board_scene = ChessBoardScene(resource, parent)
@@ -85,13 +195,18 @@ class ChessBoard(QObject):
     def show(self):
         self.board_view.show()
 
-    turnChanged = Signal()
-    gameOverWin = Signal(PieceType)
+    @staticmethod
+    def setDebugMode(enabled : bool) -> None:
+        global DEBUG
+        DEBUG = enabled
+
+    turnChanged = Signal(int)
+    gameOverWin = Signal(int)
     gameOverTie = Signal()
     
     # Chess-board event handler
     def boardClickHandler(self, pos : QPoint) -> None:
-        if self.debug_mode == True:
+        if DEBUG:
             print(f'ChessBoard.boardClickHandler() : ')
             print(f' - pos : ({pos.x()}, {pos.y()})')
         
@@ -107,9 +222,9 @@ class ChessBoard(QObject):
         if self.__is_in_focus == True:
             # Get rank/file coordinate for clicked square
             _new_rank, _new_file = ChessBoard.__get_square_from_pos(pos, self.__reversed)
-            if self.debug_mode == True:
+            if DEBUG:
                 if (_new_rank, _new_file) != (-1, -1):
-                    print(f'{ChessPiece.fileDict[_new_file]}{ChessPiece.rankDict[_new_rank]} square')
+                    print(f'{FILE_CHARS[_new_file]}{RANK_CHARS[_new_rank]} square')
                 else:
                     print(f'Boundary')
             
@@ -127,10 +242,10 @@ class ChessBoard(QObject):
         self.__free_focus()
 
     def pieceClickHandler(self, piece : ChessPiece) -> None:
-        if self.debug_mode == True:
+        if DEBUG:
             _rank, _file = piece.Square()
             print(f'ChessBoard.pieceClickHandler() : ')
-            print(f' - Clicked Piece : {piece.ObjectName()} at {ChessPiece.fileDict[_file]}{ChessPiece.rankDict[_rank]} square')
+            print(f' - Clicked Piece : {piece.ObjectName()} at {FILE_CHARS[_file]}{RANK_CHARS[_rank]} square')
         
         # Freeze : Do not interact
         if self.__is_in_freeze == True:
@@ -144,7 +259,7 @@ class ChessBoard(QObject):
         # If so, check whether current piece is clicked for capturing or not.
         if self.__is_in_focus == True:
             # Opponent piece : Check if piece is clicked for capturing
-            if ChessPiece.isOpponentPiece(piece.PieceType(), self.__turn):
+            if piece.PieceColor() != self.__turn:
                 # Get square information
                 _new_rank, _new_file = piece.Square()
 
@@ -165,7 +280,7 @@ class ChessBoard(QObject):
         else:
             # Check whether the piece is of current turn.
             # If so, set focus on clicked piece.
-            if ChessPiece.isMyPiece(piece.PieceType(), self.__turn):
+            if piece.PieceColor() == self.__turn:
                 self.__set_focus_on_piece(piece)
             
             # Otherwise, ignore the mouse input.
@@ -173,7 +288,7 @@ class ChessBoard(QObject):
                 pass
 
     def promotionItemClickHandler(self, item : PromotionItem, pos : QPoint) -> None:
-        if self.debug_mode == True:
+        if DEBUG:
             print(f'ChessBoard.promotionItemClickHandler()')
         
         if self.__is_in_promotion == False:
@@ -217,13 +332,22 @@ class ChessBoard(QObject):
     ### Initializers              ###
     #################################
     def __init_animation_item(self):
-        # Timeline for animation
-        self.timeline = QTimeLine(100)
-        self.timeline.setUpdateInterval(1)
-
-        # Animation Instance
-        self.animation = QGraphicsItemAnimation(self)
-        self.animation.setTimeLine(self.timeline)
+        # Animation Instances : Piece to move / Auxiliary piece (Rook in castling)
+        # Qt interpolates the 'pos' property of the piece between start and end.
+        self.animation = QPropertyAnimation()
+        self.animation.setPropertyName(b"pos")
+        self.animation.setDuration(100)
+        self.animation.setEasingCurve(QEasingCurve.Type.Linear)
+
+        self.aux_animation = QPropertyAnimation()
+        self.aux_animation.setPropertyName(b"pos")
+        self.aux_animation.setDuration(100)
+        self.aux_animation.setEasingCurve(QEasingCurve.Type.Linear)
+
+        # Animation Group : Run the animations simultaneously
+        # (Auxiliary animation joins the group only for castling)
+        self.animation_group = QParallelAnimationGroup(self)
+        self.animation_group.addAnimation(self.animation)
 
     def __init_chess_board(self):
         self.__turn = PieceType.WHITE      # Turn
@@ -237,25 +361,10 @@ class ChessBoard(QObject):
         self.__item_highlight : list[QGraphicsPixmapItem] = []
         self.__move_history : list[PieceMove] = [] # Sequence of piece moves
         self.__is_in_promotion = False      # Promotion mode
+        self.__castling_rights = 0b1111     # Castling rights (see __CASTLING_RIGHT_BIT)
 
-        self.board_status = [
-            [PieceType.WHITE_ROOK, PieceType.WHITE_KNIGHT, PieceType.WHITE_BISHOP, PieceType.WHITE_QUEEN, 
-             PieceType.WHITE_KING, PieceType.WHITE_BISHOP, PieceType.WHITE_KNIGHT, PieceType.WHITE_ROOK],
-            [PieceType.WHITE_PAWN, PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN,
-             PieceType.WHITE_PAWN, PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.BLACK_PAWN, PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN,
-             PieceType.BLACK_PAWN, PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN],
-            [PieceType.BLACK_ROOK, PieceType.BLACK_KNIGHT, PieceType.BLACK_BISHOP, PieceType.BLACK_QUEEN, 
-             PieceType.BLACK_KING, PieceType.BLACK_BISHOP, PieceType.BLACK_KNIGHT, PieceType.BLACK_ROOK]
-        ]
+        # Board status : A row of bytes (piece type) per rank
+        self.board_status : list[bytearray] = [bytearray(_row) for _row in INITIAL_BOARD]
     
     def __init_chess_piece(self):
         self.item_white_king     = ChessPiece(0, 4, PieceType.WHITE_KING,   self.resource, 'white-king')
@@ -309,18 +418,24 @@ class ChessBoard(QObject):
         self.board_scene.addItem(self.item_white_pawn_g);   self.board_scene.addItem(self.item_black_pawn_g)
         self.board_scene.addItem(self.item_white_pawn_h);   self.board_scene.addItem(self.item_black_pawn_h)
 
-        self.active_white_piece = [
+        # Active pieces : Insertion-ordered dict used as a set (O(1) removal on capture)
+        self.active_white_piece : dict[ChessPiece, None] = dict.fromkeys([
             self.item_white_king,     self.item_white_queen,    self.item_white_rook_a,   self.item_white_rook_h,
             self.item_white_bishop_c, self.item_white_bishop_f, self.item_white_knight_b, self.item_white_knight_g,
             self.item_white_pawn_a,   self.item_white_pawn_b,   self.item_white_pawn_c,   self.item_white_pawn_d,
             self.item_white_pawn_e,   self.item_white_pawn_f,   self.item_white_pawn_g,   self.item_white_pawn_h
-        ]
-        self.active_black_piece = [
+        ])
+        self.active_black_piece : dict[ChessPiece, None] = dict.fromkeys([
             self.item_black_king,     self.item_black_queen,    self.item_black_rook_a,   self.item_black_rook_h,
             self.item_black_bishop_c, self.item_black_bishop_f, self.item_black_knight_b, self.item_black_knight_g,
             self.item_black_pawn_a,   self.item_black_pawn_b,   self.item_black_pawn_c,   self.item_black_pawn_d,
             self.item_black_pawn_e,   self.item_black_pawn_f,   self.item_black_pawn_g,   self.item_black_pawn_h
-        ]
+        ])
+
+        # Reset plan : (piece, initial rank, initial file), taken while every piece sits on its initial square
+        self.__initial_white_piece = tuple(self.active_white_piece)
+        self.__initial_black_piece = tuple(self.active_black_piece)
+        self.__reset_plan = tuple((_piece, *_piece.Square()) for _piece in self.__initial_white_piece + self.__initial_black_piece)
 
     def __init_promotion_item(self):
         self.item_promotion_white = PromotionItem(PromotionItem.VERTICAL, PieceType.WHITE, self.resource)
@@ -335,7 +450,7 @@ class ChessBoard(QObject):
         self.board_view.boardClicked.connect(self.boardClickHandler)
         self.board_view.pieceClicked.connect(self.pieceClickHandler)
         self.board_view.promotionItemClicked.connect(self.promotionItemClickHandler)
-        self.timeline.finished.connect(self.__process_after_move)
+        self.animation_group.finished.connect(self.__process_after_move)
 
     # Methods for Chess Board Management by Main Window
 
@@ -354,15 +469,15 @@ class ChessBoard(QObject):
     # Methods for game management
 
     @staticmethod
-    def __apply_move_to_board_status(move : PieceMove, boardStatus : list[list[PieceType]]) -> None:
+    def __apply_move_to_board_status(move : PieceMove, boardStatus : list[bytearray]) -> None:
+        _old_rank, _old_file = move.OldSquare()
+        _new_rank, _new_file = move.NewSquare()
+        _piece = move.PieceToMove().PieceType()
+
         match move.MoveType():
             # Basic move
             case MoveType.BASIC | MoveType.PROMOTION:
-                _old_rank, _old_file = move.OldSquare()
-                _new_rank, _new_file = move.NewSquare()
-                
-                boardStatus[_old_rank][_old_file] = PieceType.EMPTY
-                boardStatus[_new_rank][_new_file] = move.PieceToMove().PieceType()
+                _apply_move(boardStatus, _old_rank, _old_file, _new_rank, _new_file, _piece)
             
             # Castling
             case MoveType.CASTLING_K | MoveType.CASTLING_Q:
@@ -372,15 +487,10 @@ class ChessBoard(QObject):
                     print(f'Error : Castling move has NoneType auxiliary square')
                     exit()
                 
-                _king_old_rank, _king_old_file = move.OldSquare()
-                _king_new_rank, _king_new_file = move.NewSquare()
                 _rook_old_rank, _rook_old_file = _aux_square[0]
                 _rook_new_rank, _rook_new_file = _aux_square[1]
-
-                boardStatus[_king_old_rank][_king_old_file] = PieceType.EMPTY
-                boardStatus[_king_new_rank][_king_new_file] = move.PieceToMove().PieceType()
-                boardStatus[_rook_old_rank][_rook_old_file] = PieceType.EMPTY
-                boardStatus[_rook_new_rank][_rook_new_file] = move.PieceAux().PieceType()
+                _apply_move(boardStatus, _old_rank, _old_file, _new_rank, _new_file, _piece,
+                            _rook_old_rank, _rook_old_file, _rook_new_rank, _rook_new_file, move.PieceAux().PieceType())
             
             # En passant
             case MoveType.EN_PASSANT:
@@ -390,13 +500,9 @@ class ChessBoard(QObject):
                     print(f'Error : En passant move has NoneType auxiliary square')
                     exit()
                 
-                _old_rank, _old_file = move.OldSquare()
-                _new_rank, _new_file = move.NewSquare()
                 _aux_rank, _aux_file = _aux_square[0]
-
-                boardStatus[_old_rank][_old_file] = PieceType.EMPTY
-                boardStatus[_new_rank][_new_file] = move.PieceToMove().PieceType()
-                boardStatus[_aux_rank][_aux_file] = PieceType.EMPTY
+                _apply_move(boardStatus, _old_rank, _old_file, _new_rank, _new_file, _piece,
+                            _aux_rank, _aux_file)
         
         # ChessBoard.__print_board_status(boardStatus)
 
@@ -409,7 +515,7 @@ class ChessBoard(QObject):
             # Winner's turn
             _winner : PieceType = self.__turn ^ PieceType.COLOR_MASK
 
-            if self.debug_mode == True:
+            if DEBUG:
                 _str_winner = 'White' if _winner == PieceType.WHITE else 'Black'
                 print(f'Checkmate by {_str_winner}')
             
@@ -421,14 +527,14 @@ class ChessBoard(QObject):
             return
 
     @staticmethod
-    def __check_king_safety(turn : PieceType, boardStatus : list[list[PieceType]]) -> bool:
+    def __check_king_safety(turn : PieceType, boardStatus : list[bytearray]) -> bool:
         # Find the square of king
         _king_rank, _king_file = -1, -1
         for _rank in range(8):
             for _file in range(8):
                 _piece_on_square = boardStatus[_rank][_file]
-                if ChessPiece.getPieceColor(_piece_on_square) == turn and \
-                   ChessPiece.getPieceKind(_piece_on_square) == PieceType.KING:
+                if getPieceColor(_piece_on_square) == turn and \
+                   getPieceKind(_piece_on_square) == PieceType.KING:
                     _king_rank, _king_file = _rank, _file
                     break
         
@@ -439,249 +545,38 @@ class ChessBoard(QObject):
             exit()
         
         # Check if there is an opponent piece that attacks our king
-        _is_king_on_attack = False
-
-        # 1. UP
-        _rank, _file = _king_rank + 1, _king_file
-        _dist = 1
-        while _rank < 8:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
-            
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _rank += 1; _dist += 1
-                continue
-
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First meet by opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.ROOK, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 2. DOWN
-        _rank, _file = _king_rank - 1, _king_file
-        _dist = 1
-        while _rank >= 0:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
-            
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _rank -= 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First meet by opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.ROOK, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 3. LEFT
-        _rank, _file = _king_rank, _king_file - 1
-        _dist = 1
-        while _file >= 0:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
-            
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _file -= 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First meet by opponent piece : Check if the piece can attack the king, then break
-            else:
-                _attackable_piece = [PieceType.ROOK, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
+        # 1. Along each direction : First piece met on the path
+        for _movedir, _attackable_piece, _attackable_adjacent in ChessBoard.__KING_RAYS[turn]:
+            _dist = 1
+            for _rank, _file in RAY_TABLE[_movedir][_king_rank][_king_file]:
+                _piece_on_path = boardStatus[_rank][_file]
+
+                # Empty square : Keep going
+                if isEmpty(_piece_on_path):
+                    _dist += 1
+                    continue
+
+                # First meet by opponent piece : Check if the piece can attack the king
+                if isOpponentPiece(_piece_on_path, turn):
+                    _kind = getPieceKind(_piece_on_path)
+                    if _kind in _attackable_piece or \
+                       (_dist == 1 and _kind in _attackable_adjacent):
+                        return False
+
+                # Blocked by any piece : Break
                 break
-        
-        # 4. RIGHT
-        _rank, _file = _king_rank, _king_file + 1
-        _dist = 1
-        while _file < 8:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
 
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _file += 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First meet by opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.ROOK, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 5. LEFT-UP
-        _rank, _file = _king_rank + 1, _king_file - 1
-        _dist = 1
-        while _rank < 8 and _file >= 0:
+        # 2. KNIGHT
+        for _rank, _file in KNIGHT_TABLE[_king_rank][_king_file]:
             # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
+            _piece_on_square = boardStatus[_rank][_file]
 
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _rank += 1; _file -= 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First piece meet is opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.BISHOP, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                    if turn == PieceType.WHITE:
-                        _attackable_piece.append(PieceType.PAWN)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 6. RIGHT-UP
-        _rank, _file = _king_rank + 1, _king_file + 1
-        _dist = 1
-        while _rank < 8 and _file < 8:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
-
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _rank += 1; _file += 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First piece meet is opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.BISHOP, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                    if turn == PieceType.WHITE: # Pawn can attack
-                        _attackable_piece.append(PieceType.PAWN)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 7. LEFT-DOWN
-        _rank, _file = _king_rank - 1, _king_file - 1
-        _dist = 1
-        while _rank >= 0 and _file >= 0:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
-
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _rank -= 1; _file -= 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First piece meet is opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.BISHOP, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                    if turn == PieceType.BLACK: # Pawn can attack
-                        _attackable_piece.append(PieceType.PAWN)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 8. RIGHT-DOWN
-        _rank, _file = _king_rank - 1, _king_file + 1
-        _dist = 1
-        while _rank >= 0 and _file < 8:
-            # Get square information
-            _piece_on_path = boardStatus[_rank][_file]
+            # Check if the square is of opponent knight
+            if isOpponentPiece(_piece_on_square, turn) and \
+               getPieceKind(_piece_on_square) == PieceType.KNIGHT:
+                return False
 
-            # Empty square : Keep going
-            if ChessPiece.isEmpty(_piece_on_path):
-                _rank -= 1; _file += 1; _dist += 1
-                continue
-            
-            # Blocked by ally piece : Break
-            elif ChessPiece.isMyPiece(_piece_on_path, turn):
-                break
-            
-            # First piece meet is opponent piece : Check if the piece can attack the king
-            else:
-                _attackable_piece = [PieceType.BISHOP, PieceType.QUEEN]
-                if _dist == 1: # King can attack
-                    _attackable_piece.append(PieceType.KING)
-                    if turn == PieceType.BLACK: # Pawn can attack
-                        _attackable_piece.append(PieceType.PAWN)
-                
-                if ChessPiece.getPieceKind(_piece_on_path) in _attackable_piece:
-                    _is_king_on_attack = True
-                
-                break
-        
-        # 9. KNIGHT
-        for leap in [(-2, 1), (-1, 2), (1, 2), (2, 1),
-                     (2, -1), (1, -2), (-1, -2), (-2, -1)]:
-            _rank = _king_rank + leap[0]
-            _file = _king_file + leap[1]
-                    
-            # Check if square is valid
-            if 0 <= _rank and _rank < 8 and 0 <= _file and _file < 8:
-                # Get square information
-                _piece_on_square = boardStatus[_rank][_file]
-                
-                # Check if the square is of opponent knight
-                if ChessPiece.isOpponentPiece(_piece_on_square, turn) and \
-                   ChessPiece.getPieceKind(_piece_on_square) == PieceType.KNIGHT:
-                    _is_king_on_attack = True
-        
-        return (not _is_king_on_attack)
+        return True
 
     def __free_focus(self) -> None:
         self.__is_in_focus = False
@@ -703,11 +598,18 @@ class ChessBoard(QObject):
         
         return None
 
-    def __get_available_moves(self, piece : ChessPiece) -> bool:
-        _color = piece.PieceColor()
-        _kind  = piece.PieceKind()
-        _rank, _file = piece.Square()
-        _is_already_moved = piece.isAlreadyMoved()
+    # Pinned squares and check state of 'turn' : Fixed for a position, so callers compute them once
+    # and pass them to every __get_available_moves() call on that position.
+    def __get_legality_context(self, turn : PieceType) -> tuple[set[tuple[int, int]], bool]:
+        return (self.__get_pinned_squares(turn), not ChessBoard.__check_king_safety(turn, self.board_status))
+
+    def __get_available_moves(self, piece : ChessPiece,
+                                    pinned_squares : set[tuple[int, int]], in_check : bool) -> bool:
+        # Read piece attributes directly (hot path)
+        _color = piece._color
+        _kind  = piece._kind
+        _rank, _file = piece._rank, piece._file
+        _is_already_moved = piece._moved
 
         _cand_sqr = []
         _avail_moves : list[PieceMove] = []
@@ -758,6 +660,10 @@ class ChessBoard(QObject):
                 _cand_sqr.extend(self.__get_squares_on_path(MoveDir.LEFTDOWN,  _color, _rank, _file, 1))
                 _cand_sqr.extend(self.__get_squares_on_path(MoveDir.RIGHTDOWN, _color, _rank, _file, 1))
 
+        # Moves of a non-pinned piece (except king) cannot expose the king,
+        # so full legality check is needed only for king, pinned piece, or under check.
+        _need_legality_check = in_check or _kind == PieceType.KING or (_rank, _file) in pinned_squares
+
         # Distinguish legal moves
         for _cand_rank, _cand_file in _cand_sqr:
             # Check if the move is promotion move
@@ -784,7 +690,7 @@ class ChessBoard(QObject):
 
             # Check if the candidate move is legal (in terms of king's safety)
             # If so, add the move into available move list
-            if self.__is_legal_move(_cand_move):
+            if not _need_legality_check or self.__is_legal_move(_cand_move):
                 _avail_moves.append(_cand_move)
             else:
                 del _cand_move
@@ -794,7 +700,7 @@ class ChessBoard(QObject):
         if _kind == PieceType.KING:
             # King-side
             if self.__is_castling_available(_color, MoveType.CASTLING_K):
-                if self.debug_mode == True:
+                if DEBUG:
                     print("Kingside Castling Available")
 
                 _rook = self.item_white_rook_h if _color == PieceType.WHITE else \
@@ -810,7 +716,7 @@ class ChessBoard(QObject):
             
             # Queen-side
             if self.__is_castling_available(_color, MoveType.CASTLING_Q):
-                if self.debug_mode == True:
+                if DEBUG:
                     print("Queenside Castling Available")
                 
                 _rook = self.item_white_rook_a if _color == PieceType.WHITE else \
@@ -827,7 +733,7 @@ class ChessBoard(QObject):
         # En passant
         if _kind == PieceType.PAWN:
             if self.__is_en_passant_available(_color, _rank, _file):
-                if self.debug_mode == True:
+                if DEBUG:
                     print("En-passant available")
                 
                 _pawn_in_capture = self.__move_history[-1].PieceToMove()
@@ -847,6 +753,36 @@ class ChessBoard(QObject):
 
         return (len(self.avail_moves) > 0)
 
+    def __get_pinned_squares(self, turn : PieceType) -> set[tuple[int, int]]:
+        _item_king = self.item_white_king if turn == PieceType.WHITE else \
+                     self.item_black_king
+        _king_rank, _king_file = _item_king.Square()
+
+        _pinned_squares = set()
+        for _movedir, _attackable_piece, _ in ChessBoard.__KING_RAYS[turn]:
+            _ally_square = None
+            for _rank, _file in RAY_TABLE[_movedir][_king_rank][_king_file]:
+                _piece_on_path = self.board_status[_rank][_file]
+
+                # Empty square : Keep going
+                if isEmpty(_piece_on_path):
+                    continue
+
+                # First piece met : Only ally piece can be pinned
+                if _ally_square == None:
+                    if not isMyPiece(_piece_on_path, turn):
+                        break
+                    _ally_square = (_rank, _file)
+                    continue
+
+                # Second piece met : Ally piece is pinned by opponent sliding piece
+                if isOpponentPiece(_piece_on_path, turn) and \
+                   getPieceKind(_piece_on_path) in _attackable_piece:
+                    _pinned_squares.add(_ally_square)
+                break
+
+        return _pinned_squares
+
     def __get_item_from_square(self, rank : int, file : int) -> ChessPiece | None:
         if self.__reversed == False:
             _pos = QPoint( (file * 100 + 50), ((7 - rank) * 100 + 45))
@@ -883,184 +819,34 @@ class ChessBoard(QObject):
     def __get_squares_on_path(self, movedir : MoveDir, color : PieceType,
                                     rank : int, file : int, maxdist : int) -> list[tuple[int, int]]:
         _squares_on_path = []
-        _dist = 1
-
-        match movedir:
-            case MoveDir.UP:
-                _curr_rank = rank + 1
-                while _curr_rank < 8 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[_curr_rank][file]
-                    
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((_curr_rank, file))
-                        _curr_rank += 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((_curr_rank, file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
-            
-            case MoveDir.DOWN:
-                _curr_rank = rank - 1
-                while _curr_rank >= 0 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[_curr_rank][file]
-                    
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((_curr_rank, file))
-                        _curr_rank -= 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((_curr_rank, file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
-            
-            case MoveDir.LEFT:
-                _curr_file = file - 1
-                while _curr_file >= 0 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[rank][_curr_file]
-
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((rank, _curr_file))
-                        _curr_file -= 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((rank, _curr_file))
-                        break
-                    # Meet Ally Piece First : Don't add the square and Finish
-                    else:
-                        break
-            
-            case MoveDir.RIGHT:
-                _curr_file = file + 1
-                while _curr_file < 8 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[rank][_curr_file]
-
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((rank, _curr_file))
-                        _curr_file += 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((rank, _curr_file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
-            
-            case MoveDir.LEFTUP:
-                _curr_rank = rank + 1
-                _curr_file = file - 1
-                while _curr_rank < 8 and _curr_file >= 0 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[_curr_rank][_curr_file]
-
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        _curr_rank += 1
-                        _curr_file -= 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
-            
-            case MoveDir.RIGHTUP:
-                _curr_rank = rank + 1
-                _curr_file = file + 1
-                while _curr_rank < 8 and _curr_file < 8 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[_curr_rank][_curr_file]
-
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        _curr_rank += 1
-                        _curr_file += 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
-            
-            case MoveDir.LEFTDOWN:
-                _curr_rank = rank - 1
-                _curr_file = file - 1
-                while _curr_rank >= 0 and _curr_file >= 0 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[_curr_rank][_curr_file]
-
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        _curr_rank -= 1
-                        _curr_file -= 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
 
-            case MoveDir.RIGHTDOWN:
-                _curr_rank = rank - 1
-                _curr_file = file + 1
-                while _curr_rank >= 0 and _curr_file < 8 and _dist <= maxdist:
-                    # Target square
-                    _piece_on_square = self.board_status[_curr_rank][_curr_file]
-
-                    # Empty on-path : Keep going
-                    if _piece_on_square == PieceType.EMPTY:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        _curr_rank -= 1
-                        _curr_file += 1
-                        _dist += 1
-                    # Meet Opponent Piece First : Can reach and then finish
-                    elif _piece_on_square & PieceType.COLOR_MASK != color:
-                        _squares_on_path.append((_curr_rank, _curr_file))
-                        break
-                    # Meet Ally Piece First : Finish
-                    else:
-                        break
-            
-            case MoveDir.KNIGHT:
-                for leap in [(-2, 1), (-1, 2), (1, 2), (2, 1),
-                             (2, -1), (1, -2), (-1, -2), (-2, -1)]:
-                    _curr_rank = rank + leap[0]
-                    _curr_file = file + leap[1]
-                    
-                    # Check if square is valid
-                    if 0 <= _curr_rank and _curr_rank < 8 and 0 <= _curr_file and _curr_file < 8:
-                        # Target square
-                        _piece_on_square = self.board_status[_curr_rank][_curr_file]
-
-                        # Check if the target square is either empty or of opponent piece
-                        if _piece_on_square == PieceType.EMPTY or \
-                           _piece_on_square & PieceType.COLOR_MASK != color:
-                            _squares_on_path.append((_curr_rank, _curr_file))
+        # Knight : Leap to a square, either empty or of opponent piece
+        if movedir == MoveDir.KNIGHT:
+            for _curr_rank, _curr_file in KNIGHT_TABLE[rank][file]:
+                # Target square
+                _piece_on_square = self.board_status[_curr_rank][_curr_file]
+
+                if _piece_on_square == PieceType.EMPTY or \
+                   _piece_on_square & PieceType.COLOR_MASK != color:
+                    _squares_on_path.append((_curr_rank, _curr_file))
+
+            return _squares_on_path
+
+        # Sliding : Follow the path up to 'maxdist' squares
+        for _curr_rank, _curr_file in RAY_TABLE[movedir][rank][file][:maxdist]:
+            # Target square
+            _piece_on_square = self.board_status[_curr_rank][_curr_file]
+
+            # Empty on-path : Keep going
+            if _piece_on_square == PieceType.EMPTY:
+                _squares_on_path.append((_curr_rank, _curr_file))
+            # Meet Opponent Piece First : Can reach and then finish
+            elif _piece_on_square & PieceType.COLOR_MASK != color:
+                _squares_on_path.append((_curr_rank, _curr_file))
+                break
+            # Meet Ally Piece First : Finish
+            else:
+                break
         
         return _squares_on_path
 
@@ -1117,16 +903,9 @@ class ChessBoard(QObject):
         
         return _candidate_square
 
-    @staticmethod
-    def __get_pos_from_square(rank : int, file : int, reversed : bool = False) -> QPoint:
-        if reversed == False:
-            return QPoint(file * 100, (7 - rank) * 100)
-        else:
-            return QPoint((7 - file) * 100, rank * 100)
-
     def __hand_player_turn(self) -> None:
         self.__turn = PieceType.BLACK if self.__turn == PieceType.WHITE else PieceType.WHITE
-        self.turnChanged.emit()
+        self.turnChanged.emit(self.__turn)
     
     def __highlight_available_moves(self) -> None:
         for _move in self.avail_moves:
@@ -1141,9 +920,13 @@ class ChessBoard(QObject):
                 _highlight.setPixmap(self.resource.highlight_circle)
             
             self.board_scene.addItem(_highlight)
-            _highlight.setPos(ChessBoard.__get_pos_from_square(_rank, _file, self.__reversed))
+            _highlight.setPos(ChessPiece.getPointFromSquare(_rank, _file, self.__reversed))
 
     def __is_castling_available(self, turn : PieceType, side : MoveType):
+        # Fast rejection : King or rook has already left its initial square
+        if not (self.__castling_rights & ChessBoard.__CASTLING_RIGHT_BIT[(turn, side)]):
+            return False
+
         match (turn, side):
             # White, King-side Castling
             case (PieceType.WHITE, MoveType.CASTLING_K):
@@ -1187,7 +970,7 @@ class ChessBoard(QObject):
             return False
         
         # Check if the castling path is under attack.
-        _tmp_board_status = deepcopy(self.board_status)
+        _tmp_board_status = [_row[:] for _row in self.board_status]
         _old_rank, _old_file = _item_king.Square()
         for _rank, _file in _square_on_path:
             # Temporarily change king's square
@@ -1231,7 +1014,7 @@ class ChessBoard(QObject):
 
     def __is_legal_move(self, move : PieceMove) -> bool:
         # Temporarily update board status to determine king's safety
-        _tmp_board_status = deepcopy(self.board_status)
+        _tmp_board_status = [_row[:] for _row in self.board_status]
         ChessBoard.__apply_move_to_board_status(move, _tmp_board_status)
 
         # Check king's safety after given move
@@ -1240,14 +1023,16 @@ class ChessBoard(QObject):
     def __is_no_avail_move(self) -> bool:
         _avail_move_exist = False
 
+        _pinned_squares, _in_check = self.__get_legality_context(self.__turn)
+
         # White
         if self.__turn == PieceType.WHITE:
             for _piece in self.active_white_piece:
-                _avail_move_exist |= self.__get_available_moves(_piece)
+                _avail_move_exist |= self.__get_available_moves(_piece, _pinned_squares, _in_check)
         # Black
         elif self.__turn == PieceType.BLACK:
             for _piece in self.active_black_piece:
-                _avail_move_exist |= self.__get_available_moves(_piece)
+                _avail_move_exist |= self.__get_available_moves(_piece, _pinned_squares, _in_check)
         # Invalid case
         else:
             print(f'ChessBoard.__is_no_avail_move() : ')
@@ -1268,11 +1053,11 @@ class ChessBoard(QObject):
         print()
 
     @staticmethod
-    def __print_board_status(boardStatus : list[list[PieceType]]):
+    def __print_board_status(boardStatus : list[bytearray]):
         print("="*110)
         for _rank in range(7, -1, -1):
             for _file in range(8):
-                print(str(boardStatus[_rank][_file]), end = ' ')
+                print(PieceType.getName(boardStatus[_rank][_file]), end = ' ')
             print()
         print("="*110)
 
@@ -1284,14 +1069,13 @@ class ChessBoard(QObject):
         self.__update_piece_status(_last_move)
         self.__update_board_status(_last_move)
 
-        if self.debug_mode == True:
+        if DEBUG:
             ChessBoard.__print_board_status(self.board_status)
             self.__print_active_piece()
 
-        # Clear Animation(s)
-        self.animation.clear()
-        if _last_move.MoveType() in [MoveType.CASTLING_K, MoveType.CASTLING_Q]:
-            self.aux_animation.clear()
+        # Detach auxiliary animation (not attached when the animation was skipped)
+        if self.aux_animation.group() != None:
+            self.animation_group.removeAnimation(self.aux_animation)
         
         # Promotion
         if _last_move.MoveType() == MoveType.PROMOTION:
@@ -1326,87 +1110,57 @@ class ChessBoard(QObject):
         _piece_to_move         = move.PieceToMove()
         _old_rank, _old_file   = move.OldSquare()
         _new_rank, _new_file   = move.NewSquare()
-        _old_pos_x, _old_pos_y = ChessPiece.getPosFromSquare(_old_rank, _old_file, self.__reversed)
-        _new_pos_x, _new_pos_y = ChessPiece.getPosFromSquare(_new_rank, _new_file, self.__reversed)
-
-        self.animation.setItem(_piece_to_move)
-        for i in range(101):
-            step = i / 100
-            self.animation.setPosAt(step, QPointF(
-                _old_pos_x * (1 - step) + _new_pos_x * step,
-                _old_pos_y * (1 - step) + _new_pos_y * step
-            ))
+        _old_pos = ChessPiece.getPointFromSquare(_old_rank, _old_file, self.__reversed)
+        _new_pos = ChessPiece.getPointFromSquare(_new_rank, _new_file, self.__reversed)
+
+        # Save the move into move history
+        self.__move_history.append(move)
+
+        # Board is hidden : Nothing to show, so place pieces directly and skip the animation
+        if not self.board_view.isVisible():
+            _piece_to_move.setPos(_new_pos)
+            if move.MoveType() in [MoveType.CASTLING_K, MoveType.CASTLING_Q]:
+                _aux_new_rank, _aux_new_file = move.AuxSquare()[1]
+                move.PieceAux().setPos(ChessPiece.getPointFromSquare(_aux_new_rank, _aux_new_file, self.__reversed))
+            self.__process_after_move()
+            return
+
+        self.animation.setTargetObject(_piece_to_move)
+        self.animation.setStartValue(_old_pos)
+        self.animation.setEndValue(_new_pos)
         
         # Castling : Move Rook simultaneously
         if move.MoveType() in [MoveType.CASTLING_K, MoveType.CASTLING_Q]:
             _piece_aux = move.PieceAux()
             _aux_old_rank, _aux_old_file = move.AuxSquare()[0]
             _aux_new_rank, _aux_new_file = move.AuxSquare()[1]
-            _aux_old_pos_x, _aux_old_pos_y = ChessPiece.getPosFromSquare(_aux_old_rank, _aux_old_file, self.__reversed)
-            _aux_new_pos_x, _aux_new_pos_y = ChessPiece.getPosFromSquare(_aux_new_rank, _aux_new_file, self.__reversed)
-
-            self.aux_animation = QGraphicsItemAnimation(self)
-            self.aux_animation.setItem(_piece_aux)
-            self.aux_animation.setTimeLine(self.timeline) # Share same timeline
-
-            for i in range(101):
-                step = i / 100
-                self.aux_animation.setPosAt(step, QPointF(
-                    _aux_old_pos_x * (1 - step) + _aux_new_pos_x * step,
-                    _aux_old_pos_y * (1 - step) + _aux_new_pos_y * step
-                ))
-        
-        # Save the move into move history
-        self.__move_history.append(move)
+            _aux_old_pos = ChessPiece.getPointFromSquare(_aux_old_rank, _aux_old_file, self.__reversed)
+            _aux_new_pos = ChessPiece.getPointFromSquare(_aux_new_rank, _aux_new_file, self.__reversed)
 
-        # Start timeline : Run animation
-        self.timeline.start()
+            self.aux_animation.setTargetObject(_piece_aux)
+            self.aux_animation.setStartValue(_aux_old_pos)
+            self.aux_animation.setEndValue(_aux_new_pos)
+            self.animation_group.addAnimation(self.aux_animation) # Run with main animation
+
+        # Run animation
+        self.animation_group.start()
 
     def __remove_highlight(self) -> None:
         for _item in self.__item_highlight:
             self.board_scene.removeItem(_item)
-            del _item
         self.__item_highlight.clear()
     
     def __remove_move_history(self) -> None:
-        for _move in self.__move_history:
-            del _move
         self.__move_history.clear()
 
     def __reset_chess_board(self) -> None:
         # Reset all pieces
-        self.item_white_king    .reset(0, 4);     self.item_black_king    .reset(7, 4)
-        self.item_white_queen   .reset(0, 3);     self.item_black_queen   .reset(7, 3)
-        self.item_white_rook_a  .reset(0, 0);     self.item_black_rook_a  .reset(7, 0)
-        self.item_white_rook_h  .reset(0, 7);     self.item_black_rook_h  .reset(7, 7)
-        self.item_white_bishop_c.reset(0, 2);     self.item_black_bishop_c.reset(7, 2)
-        self.item_white_bishop_f.reset(0, 5);     self.item_black_bishop_f.reset(7, 5)
-        self.item_white_knight_b.reset(0, 1);     self.item_black_knight_b.reset(7, 1)
-        self.item_white_knight_g.reset(0, 6);     self.item_black_knight_g.reset(7, 6)
-
-        self.item_white_pawn_a.reset(1, 0);       self.item_black_pawn_a.reset(6, 0)
-        self.item_white_pawn_b.reset(1, 1);       self.item_black_pawn_b.reset(6, 1)
-        self.item_white_pawn_c.reset(1, 2);       self.item_black_pawn_c.reset(6, 2)
-        self.item_white_pawn_d.reset(1, 3);       self.item_black_pawn_d.reset(6, 3)
-        self.item_white_pawn_e.reset(1, 4);       self.item_black_pawn_e.reset(6, 4)
-        self.item_white_pawn_f.reset(1, 5);       self.item_black_pawn_f.reset(6, 5)
-        self.item_white_pawn_g.reset(1, 6);       self.item_black_pawn_g.reset(6, 6)
-        self.item_white_pawn_h.reset(1, 7);       self.item_black_pawn_h.reset(6, 7)
+        for _piece, _rank, _file in self.__reset_plan:
+            _piece.reset(_rank, _file)
 
         # Activate every piece
-        self.active_white_piece.clear(); self.active_black_piece.clear()
-        self.active_white_piece = [
-            self.item_white_king,     self.item_white_queen,    self.item_white_rook_a,   self.item_white_rook_h,
-            self.item_white_bishop_c, self.item_white_bishop_f, self.item_white_knight_b, self.item_white_knight_g,
-            self.item_white_pawn_a,   self.item_white_pawn_b,   self.item_white_pawn_c,   self.item_white_pawn_d,
-            self.item_white_pawn_e,   self.item_white_pawn_f,   self.item_white_pawn_g,   self.item_white_pawn_h
-        ]
-        self.active_black_piece = [
-            self.item_black_king,     self.item_black_queen,    self.item_black_rook_a,   self.item_black_rook_h,
-            self.item_black_bishop_c, self.item_black_bishop_f, self.item_black_knight_b, self.item_black_knight_g,
-            self.item_black_pawn_a,   self.item_black_pawn_b,   self.item_black_pawn_c,   self.item_black_pawn_d,
-            self.item_black_pawn_e,   self.item_black_pawn_f,   self.item_black_pawn_g,   self.item_black_pawn_h
-        ]
+        self.active_white_piece = dict.fromkeys(self.__initial_white_piece)
+        self.active_black_piece = dict.fromkeys(self.__initial_black_piece)
         
         # Reset game status
         self.__turn = PieceType.WHITE
@@ -1414,25 +1168,9 @@ class ChessBoard(QObject):
         self.__free_focus()
         self.__remove_move_history()
         self.__is_in_promotion = False
-        self.board_status.clear()
-        self.board_status = [
-            [PieceType.WHITE_ROOK, PieceType.WHITE_KNIGHT, PieceType.WHITE_BISHOP, PieceType.WHITE_QUEEN, 
-             PieceType.WHITE_KING, PieceType.WHITE_BISHOP, PieceType.WHITE_KNIGHT, PieceType.WHITE_ROOK],
-            [PieceType.WHITE_PAWN, PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN,
-             PieceType.WHITE_PAWN, PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN,   PieceType.WHITE_PAWN],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY, 
-             PieceType.EMPTY,      PieceType.EMPTY,        PieceType.EMPTY,        PieceType.EMPTY],
-            [PieceType.BLACK_PAWN, PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN,
-             PieceType.BLACK_PAWN, PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN,   PieceType.BLACK_PAWN],
-            [PieceType.BLACK_ROOK, PieceType.BLACK_KNIGHT, PieceType.BLACK_BISHOP, PieceType.BLACK_QUEEN, 
-             PieceType.BLACK_KING, PieceType.BLACK_BISHOP, PieceType.BLACK_KNIGHT, PieceType.BLACK_ROOK]
-        ]
+        self.__castling_rights = 0b1111
+        for _row, _initial_row in zip(self.board_status, INITIAL_BOARD):
+            _row[:] = _initial_row
 
     def __reverse_chess_board(self) -> None:
         self.__reversed = not self.__reversed
@@ -1454,16 +1192,16 @@ class ChessBoard(QObject):
         self.__piece_in_focus = piece
 
         # Get available moves
-        self.__get_available_moves(piece)
+        self.__get_available_moves(piece, *self.__get_legality_context(piece.PieceColor()))
 
         # Show available squares on the command
-        if self.debug_mode == True:
+        if DEBUG:
             if len(self.avail_moves) > 0:
                 print('Available squares : ', end='')
                 print('| ', end='')
                 for _move in self.avail_moves:
                     _rank, _file = _move.NewSquare()
-                    _str = ChessPiece.fileDict[_file] + ChessPiece.rankDict[_rank]
+                    _str = FILE_CHARS[_file] + RANK_CHARS[_rank]
                     print(_str, end = ' | ')
                 print()
             else:
@@ -1481,6 +1219,10 @@ class ChessBoard(QObject):
         _piece_to_move.setMoved()
         _piece_to_move.setSquare(_new_rank, _new_file)
 
+        # Revoke castling rights of moved king / rook (or captured rook)
+        self.__castling_rights &= ~(ChessBoard.__CASTLING_RIGHT_MASK.get(move.OldSquare(), 0) |
+                                    ChessBoard.__CASTLING_RIGHT_MASK.get(move.NewSquare(), 0))
+
         _piece_in_capture = move.PieceInCapture()
         if _piece_in_capture != None:
             # Set invisible
@@ -1488,9 +1230,9 @@ class ChessBoard(QObject):
 
             # Remove from active piece list
             if _piece_in_capture.PieceColor() == PieceType.WHITE:
-                self.active_white_piece.remove(_piece_in_capture)
+                del self.active_white_piece[_piece_in_capture]
             elif _piece_in_capture.PieceColor() == PieceType.BLACK:
-                self.active_black_piece.remove(_piece_in_capture)
+                del self.active_black_piece[_piece_in_capture]
             else:
                 exit()
         
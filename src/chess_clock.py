@@ -1,6 +1,8 @@
+import time as _time
+
 from PySide6.QtCore import (Qt, QObject, QRect, QRectF,
                             QTimer, Signal, Slot)
-from PySide6.QtWidgets import QWidget, QLCDNumber
+from PySide6.QtWidgets import QLCDNumber
 
 class ChessClock(QObject):
     def __init__(self, time : int,
@@ -14,8 +16,11 @@ class ChessClock(QObject):
         self.clock_lcd.setSegmentStyle(QLCDNumber.Filled)
 
     # Initialize Inner-Timer
-        self.clock_timer.setTimerType(Qt.PreciseTimer)
+        # Coarse timer is enough : Displayed time is derived from the monotonic clock,
+        # so timer jitter never accumulates (and the OS may coalesce wake-ups).
+        self.clock_timer.setTimerType(Qt.CoarseTimer)
         self.clock_timer.stop()
+        self.clock_timer.setSingleShot(False)
         self.clock_timer.setInterval(1000) # 1 second
     
     # Initialize variables for clock management
@@ -24,6 +29,8 @@ class ChessClock(QObject):
         self.base_time = time
         self.fischer_time = fischer
         self.clock_time = self.base_time
+        self.__time_strings = ChessClock.__make_time_strings(self.base_time)
+        self.__reset_elapsed()
         self.__display_time()
 
     # Connect inside signal-slot
@@ -43,14 +50,19 @@ class ChessClock(QObject):
             print("ChessClock.setTimer() received negative time factor.")
             exit()
         
+        # A new time control discards the running one
+        self.clock_timer.stop()
         self.launched = False
         self.unlimited = False
         self.base_time = time
         self.fischer_time = fischer
         self.clock_time = time
+        self.__time_strings = ChessClock.__make_time_strings(time)
+        self.__reset_elapsed()
         self.__display_time()
     
     def setUnlimited(self):
+        self.clock_timer.stop()
         self.launched = False
         self.unlimited = True
         self.clock_lcd.display("--:--")
@@ -61,18 +73,26 @@ class ChessClock(QObject):
     def startClock(self):
         if self.unlimited == False:
             self.launched = True
+            self.__t0 = _time.monotonic()
             self.clock_timer.start(1000)
     
     def pauseClock(self):
         if self.unlimited == False:
-            self.__remaining_time = self.clock_timer.remainingTime()
+            # Accumulate running time only if the clock is actually running (not already paused)
+            if self.clock_timer.isActive():
+                self.__elapsed += _time.monotonic() - self.__t0
             self.clock_timer.stop()
     
     def resumeClock(self):
         if self.unlimited == False:
             if self.launched == True:
+                self.__bonus += self.fischer_time
                 self.clock_time += self.fischer_time
-                self.clock_timer.start(self.__remaining_time)
+                self.__t0 = _time.monotonic()
+
+                # First tick after the remainder of the interrupted second; __update_clock() restores 1 second
+                _phase = 1000 - int(self.__elapsed * 1000) % 1000
+                self.clock_timer.start(_phase)
             else:
                 self.startClock()
     
@@ -80,25 +100,44 @@ class ChessClock(QObject):
         self.launched = False
         self.clock_timer.stop()
         self.clock_time = self.base_time
+        self.__reset_elapsed()
         self.__display_time()
 
+    def __reset_elapsed(self):
+        self.__t0 = 0.0       # Monotonic time when the clock was last started / resumed
+        self.__elapsed = 0.0  # Running time accumulated before the last start / resume
+        self.__bonus = 0      # Fischer increments granted so far
+
     @Slot()
     def __update_clock(self):
-        self.clock_time -= 1
+        # Back to regular interval after the shortened tick of resumeClock()
+        if self.clock_timer.interval() != 1000:
+            self.clock_timer.setInterval(1000)
+
+        # Nearest whole second, so a slightly early or late tick still shows the right value
+        _running = self.__elapsed + _time.monotonic() - self.__t0
+        self.clock_time = max(0, self.base_time + self.__bonus - round(_running))
         self.__display_time()
 
         if self.clock_time == 0:
             self.clock_timer.stop()
             self.timeOut.emit()
-            return
-        
-        self.clock_timer.start(1000)
 
     def __display_time(self):
-        __min = self.clock_time // 60
-        __sec = self.clock_time % 60
-        __display_str = f'{__min}:{__sec}' if __sec >= 10 else \
-                        f'{__min}:0{__sec}'
+        # Fischer increment can raise the clock above base time : Format such values on demand
+        if self.clock_time < len(self.__time_strings):
+            __display_str = self.__time_strings[self.clock_time]
+        else:
+            __display_str = ChessClock.__format_time(self.clock_time)
         self.clock_lcd.display(__display_str)
 
+    @staticmethod
+    def __format_time(time : int) -> str:
+        return f'{time // 60}:{time % 60:02d}'
+
+    # Display strings for every clock time from 0 to base time, built once per setTimer()
+    @staticmethod
+    def __make_time_strings(time : int) -> tuple[str, ...]:
+        return tuple(ChessClock.__format_time(_time) for _time in range(time + 1))
+
     
\ No newline at end of file
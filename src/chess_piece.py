@@ -1,13 +1,14 @@
-import os
 from enum import IntEnum
 
-from PySide6.QtCore import Qt, QObject, QPoint, QPointF
-from PySide6.QtGui import QCursor, QPixmap
-from PySide6.QtWidgets import QWidget, QGraphicsItem, QGraphicsPixmapItem
+from PySide6.QtCore import QPointF, QRectF
+from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QRegion
+from PySide6.QtWidgets import QWidget, QGraphicsItem, QGraphicsObject, QStyleOptionGraphicsItem
 
 from image import ChessImage
+from .cursor import getPointingCursor
 
-class PieceType(IntEnum):
+# Piece type : Plain int constants (bit-flags), so that masking / comparing stays a raw int operation
+class PieceType:
     WHITE = 0x00
     BLACK = 0x40
 
@@ -37,19 +38,20 @@ class PieceType(IntEnum):
     BLACK_KNIGHT = BLACK | KNIGHT
     BLACK_PAWN   = BLACK | PAWN
 
-    def __str__(self):
+    @staticmethod
+    def getName(piecetype : int) -> str:
         _str = ''
 
-        if self.value == PieceType.EMPTY:
+        if piecetype == PieceType.EMPTY:
             _str = 'Empty       '
             return _str
 
-        if self.value & PieceType.COLOR_MASK == PieceType.WHITE:
+        if piecetype & PieceType.COLOR_MASK == PieceType.WHITE:
             _str += 'White-'
         else:
             _str += 'Black-'
         
-        match (self.value & PieceType.PIECE_MASK):
+        match (piecetype & PieceType.PIECE_MASK):
             case PieceType.PAWN:
                 _str += 'pawn  '
             case PieceType.KNIGHT:
@@ -65,10 +67,65 @@ class PieceType(IntEnum):
         
         return _str
 
-class ChessPiece(QGraphicsPixmapItem):
-    # Rank / File Converter
-    rankDict = { 0 : '1', 1 : '2', 2 : '3', 3 : '4', 4 : '5', 5 : '6', 6 : '7', 7 : '8' }
-    fileDict = { 0 : 'a', 1 : 'b', 2 : 'c', 3 : 'd', 4 : 'e', 5 : 'f', 6 : 'g', 7 : 'h' }
+# Rank / File Converter : Algebraic name of rank / file index
+RANK_CHARS = '12345678'
+FILE_CHARS = 'abcdefgh'
+
+# Lookup tables indexed by piece type (piece types fit in 7 bits)
+_COLOR_OF = bytes(_pt & PieceType.COLOR_MASK for _pt in range(128))
+_KIND_OF  = bytes(_pt & PieceType.PIECE_MASK for _pt in range(128))
+_IS_WHITE = bytes(int(_pt != PieceType.EMPTY and _pt & PieceType.COLOR_MASK == PieceType.WHITE) for _pt in range(128))
+_IS_BLACK = bytes(int(_pt != PieceType.EMPTY and _pt & PieceType.COLOR_MASK == PieceType.BLACK) for _pt in range(128))
+
+# _IS_MINE / _IS_OPPONENT[(turn << 1) | piecetype] : Turn (0x00 / 0x40) selects the lower / upper 128 entries.
+# An empty square is neither mine nor opponent's.
+_IS_MINE     = bytes(int(_pt != PieceType.EMPTY and _pt & PieceType.COLOR_MASK == _turn)
+                     for _turn in (PieceType.WHITE, PieceType.BLACK) for _pt in range(128))
+_IS_OPPONENT = bytes(int(_pt != PieceType.EMPTY and _pt & PieceType.COLOR_MASK != _turn)
+                     for _turn in (PieceType.WHITE, PieceType.BLACK) for _pt in range(128))
+
+def getPieceColor(piecetype : PieceType) -> PieceType:
+    return _COLOR_OF[piecetype]
+
+def getPieceKind(piecetype : PieceType) -> PieceType:
+    return _KIND_OF[piecetype]
+
+def isWhitePiece(piecetype : PieceType) -> bool:
+    return _IS_WHITE[piecetype] == 1
+
+def isBlackPiece(piecetype : PieceType) -> bool:
+    return _IS_BLACK[piecetype] == 1
+
+def isEmpty(piecetype : PieceType) -> bool:
+    return (piecetype == PieceType.EMPTY)
+
+def isMyPiece(piecetype : PieceType, turn : PieceType) -> bool:
+    return _IS_MINE[(turn << 1) | piecetype] == 1
+
+def isOpponentPiece(piecetype : PieceType, turn : PieceType) -> bool:
+    return _IS_OPPONENT[(turn << 1) | piecetype] == 1
+
+class ChessPiece(QGraphicsObject):
+    # Piece type -> Pixmap attribute of ChessImage
+    __PIXMAP_ATTR = {
+        PieceType.WHITE_KING   : 'white_king',   PieceType.BLACK_KING   : 'black_king',
+        PieceType.WHITE_QUEEN  : 'white_queen',  PieceType.BLACK_QUEEN  : 'black_queen',
+        PieceType.WHITE_ROOK   : 'white_rook',   PieceType.BLACK_ROOK   : 'black_rook',
+        PieceType.WHITE_BISHOP : 'white_bishop', PieceType.BLACK_BISHOP : 'black_bishop',
+        PieceType.WHITE_KNIGHT : 'white_knight', PieceType.BLACK_KNIGHT : 'black_knight',
+        PieceType.WHITE_PAWN   : 'white_pawn',   PieceType.BLACK_PAWN   : 'black_pawn'
+    }
+
+    # Pixmap cache key -> Hit-test shape : Pieces of a type share the pixmap of ChessImage, so build its shape once
+    __SHAPE_CACHE : dict[int, QPainterPath] = {}
+
+    # Square -> Position converter : [rank][file] -> (x, y) on normal / reversed board
+    POS_TABLE     = tuple(tuple((_file * 100.0, (7 - _rank) * 100.0) for _file in range(8)) for _rank in range(8))
+    POS_TABLE_REV = tuple(tuple(((7 - _file) * 100.0, _rank * 100.0) for _file in range(8)) for _rank in range(8))
+
+    # Same positions as QPointF, shared to avoid constructing points on every move
+    POINT_TABLE     = tuple(tuple(QPointF(_x, _y) for _x, _y in _row) for _row in POS_TABLE)
+    POINT_TABLE_REV = tuple(tuple(QPointF(_x, _y) for _x, _y in _row) for _row in POS_TABLE_REV)
 
     def __init__(self, rank : int = -1, file : int = -1,
                        piecetype : PieceType = PieceType.EMPTY,
@@ -76,23 +133,63 @@ class ChessPiece(QGraphicsPixmapItem):
                        objname : str = '',
                        parent : QGraphicsItem | None = None):
         super().__init__(parent)
-        self.__rank : int = rank
-        self.__file : int = file
+        self.__pixmap : QPixmap = QPixmap()
+        self.__shape : QPainterPath = QPainterPath()
+
+        # Square / color / kind / moved-flag are read directly by move generation
+        self._rank : int = rank
+        self._file : int = file
+        self.__square : tuple[int, int] = (rank, file) # Returned by Square() without re-packing
 
-        self.__piece_type : PieceType = piecetype
+        self.__piece_type : int = piecetype
+        self._color : int = self.__piece_type & PieceType.COLOR_MASK
+        self._kind  : int = self.__piece_type & PieceType.PIECE_MASK
         
         self.__resource : ChessImage | None = resource
         
         self.__object_name : str = objname
         
-        self.__is_already_moved : bool = False
+        self._moved : bool = False
 
         self.__reversed : bool = False
         
         self.__set_pixmap()
         self.__update_pos()
         
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setCursor(getPointingCursor())
+
+    # Painting : Draw pixmap as QGraphicsPixmapItem does.
+    # (QGraphicsObject gives 'pos' property, so the piece can be animated by QPropertyAnimation.)
+    def setPixmap(self, pixmap : QPixmap) -> None:
+        self.prepareGeometryChange()
+        self.__pixmap = pixmap
+
+        # Hit-test only on opaque area of the pixmap
+        _key = pixmap.cacheKey()
+        if _key not in ChessPiece.__SHAPE_CACHE:
+            _shape = QPainterPath()
+            _mask = pixmap.mask()
+            if _mask.isNull():
+                _shape.addRect(QRectF(pixmap.rect()))
+            else:
+                _shape.addRegion(QRegion(_mask))
+            ChessPiece.__SHAPE_CACHE[_key] = _shape
+        self.__shape = ChessPiece.__SHAPE_CACHE[_key]
+        self.update()
+    
+    def pixmap(self) -> QPixmap:
+        return self.__pixmap
+    
+    def boundingRect(self) -> QRectF:
+        return QRectF(self.__pixmap.rect())
+    
+    def shape(self) -> QPainterPath:
+        return self.__shape
+    
+    def paint(self, painter : QPainter,
+                    option : QStyleOptionGraphicsItem,
+                    widget : QWidget | None = None) -> None:
+        painter.drawPixmap(0, 0, self.__pixmap)
 
     # Characteristics setting methods
     def setObjectName(self, objname : str) -> None:
@@ -100,28 +197,32 @@ class ChessPiece(QGraphicsPixmapItem):
     
     def setPieceType(self, piecetype : PieceType) -> None:
         self.__piece_type = piecetype
+        self._color = self.__piece_type & PieceType.COLOR_MASK
+        self._kind  = self.__piece_type & PieceType.PIECE_MASK
 
     def setSquare(self, rank : int, file : int) -> None:
-        self.__rank = rank
-        self.__file = file
+        self._rank = rank
+        self._file = file
+        self.__square = (rank, file)
     
     def setMoved(self) -> None:
-        self.__is_already_moved = True
+        self._moved = True
     
     def unsetMoved(self) -> None:
-        self.__is_already_moved = False
+        self._moved = False
     
     def setResource(self, resource : ChessImage) -> None:
         self.__resource = resource
     
     def reset(self, rank : int, file : int) -> None:
-        self.__rank = rank
-        self.__file = file
+        self._rank = rank
+        self._file = file
+        self.__square = (rank, file)
 
         self.__reversed = False
         self.__update_pos()
 
-        self.__is_already_moved = False
+        self._moved = False
         self.setVisible(True)
     
     def reverse(self) -> None:
@@ -133,102 +234,63 @@ class ChessPiece(QGraphicsPixmapItem):
         return self.__object_name
     
     def Square(self) -> tuple[int, int]:
-        return (self.__rank, self.__file)
+        return self.__square
     
-    def PieceColor(self) -> PieceType:
-        return self.__piece_type & PieceType.COLOR_MASK
+    def PieceColor(self) -> int:
+        return self._color
     
-    def PieceKind(self) -> PieceType:
-        return self.__piece_type & PieceType.PIECE_MASK
+    def PieceKind(self) -> int:
+        return self._kind
     
-    def PieceType(self) -> PieceType:
+    def PieceType(self) -> int:
         return self.__piece_type
     
     def isAlreadyMoved(self) -> bool:
-        return self.__is_already_moved
+        return self._moved
     
     # Promotion
     def Promote(self, piecetype : PieceType) -> None:
-        if self.PieceKind() != PieceType.PAWN:
+        if self._kind != PieceType.PAWN:
             return
         
         # piecetype = piecetype & PieceType.PIECE_MASK
-        self.setPieceType(self.PieceColor() | piecetype)
+        self.setPieceType(self._color | piecetype)
         self.__set_pixmap()
 
-    @staticmethod
-    def getPieceColor(piecetype : PieceType) -> PieceType:
-        return (piecetype & PieceType.COLOR_MASK)
-    
-    @staticmethod
-    def getPieceKind(piecetype : PieceType) -> PieceType:
-        return (piecetype & PieceType.PIECE_MASK)
-    
-    @staticmethod
-    def isWhitePiece(piecetype : PieceType) -> bool:
-        return (piecetype != PieceType.EMPTY) \
-           and (piecetype & PieceType.COLOR_MASK == PieceType.WHITE)
-    
-    @staticmethod
-    def isBlackPiece(piecetype : PieceType) -> bool:
-        return (piecetype != PieceType.EMPTY) \
-           and (piecetype & PieceType.COLOR_MASK == PieceType.BLACK)
-    
-    @staticmethod
-    def isEmpty(piecetype : PieceType) -> bool:
-        return (piecetype == PieceType.EMPTY)
-
-    @staticmethod
-    def isMyPiece(piecetype : PieceType, turn : PieceType) -> bool:
-        return (ChessPiece.getPieceColor(piecetype) == turn)
+    # Piece type predicates : Module-level functions (import them directly in hot loops)
+    getPieceColor   = staticmethod(getPieceColor)
+    getPieceKind    = staticmethod(getPieceKind)
+    isWhitePiece    = staticmethod(isWhitePiece)
+    isBlackPiece    = staticmethod(isBlackPiece)
+    isEmpty         = staticmethod(isEmpty)
+    isMyPiece       = staticmethod(isMyPiece)
+    isOpponentPiece = staticmethod(isOpponentPiece)
     
     @staticmethod
-    def isOpponentPiece(piecetype : PieceType, turn : PieceType) -> bool:
-        return (ChessPiece.getPieceColor(piecetype) != turn)
+    def getPosFromSquare(rank : int, file : int, reversed : bool)  -> tuple[float, float]:
+        if reversed == False:
+            return ChessPiece.POS_TABLE[rank][file]
+        else:
+            return ChessPiece.POS_TABLE_REV[rank][file]
     
     @staticmethod
-    def getPosFromSquare(rank : int, file : int, reversed : bool)  -> tuple[float, float]:
+    def getPointFromSquare(rank : int, file : int, reversed : bool) -> QPointF:
         if reversed == False:
-            return file * 100.0, (7 - rank) * 100.0
+            return ChessPiece.POINT_TABLE[rank][file]
         else:
-            return (7 - file) * 100.0, rank * 100.0
+            return ChessPiece.POINT_TABLE_REV[rank][file]
 
     def __update_pos(self) -> None:
-        if self.__reversed == False:
-            self.setPos(self.__file * 100, (7 - self.__rank) * 100)
-        else:
-            self.setPos((7 - self.__file) * 100, self.__rank * 100)
+        self.setPos(ChessPiece.getPointFromSquare(self._rank, self._file, self.__reversed))
     
     def __set_pixmap(self) -> None:
         _resource = self.__resource
         if _resource == None:
             return
         
-        match self.__piece_type:
-            case PieceType.WHITE_KING:
-                self.setPixmap(_resource.white_king)
-            case PieceType.WHITE_QUEEN:
-                self.setPixmap(_resource.white_queen)
-            case PieceType.WHITE_ROOK:
-                self.setPixmap(_resource.white_rook)
-            case PieceType.WHITE_BISHOP:
-                self.setPixmap(_resource.white_bishop)
-            case PieceType.WHITE_KNIGHT:
-                self.setPixmap(_resource.white_knight)
-            case PieceType.WHITE_PAWN:
-                self.setPixmap(_resource.white_pawn)
-            case PieceType.BLACK_KING:
-                self.setPixmap(_resource.black_king)
-            case PieceType.BLACK_QUEEN:
-                self.setPixmap(_resource.black_queen)
-            case PieceType.BLACK_ROOK:
-                self.setPixmap(_resource.black_rook)
-            case PieceType.BLACK_BISHOP:
-                self.setPixmap(_resource.black_bishop)
-            case PieceType.BLACK_KNIGHT:
-                self.setPixmap(_resource.black_knight)
-            case PieceType.BLACK_PAWN:
-                self.setPixmap(_resource.black_pawn)
+        _attr = ChessPiece.__PIXMAP_ATTR.get(self.__piece_type)
+        if _attr != None:
+            self.setPixmap(getattr(_resource, _attr))
 
 
 class MoveType(IntEnum):
@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCursor
+
+# Pointing-hand cursor shared by every clickable item / widget.
+# Built on first use rather than at import, since QCursor needs a running QGuiApplication.
+@lru_cache(maxsize=1)
+def getPointingCursor() -> QCursor:
+    return QCursor(Qt.CursorShape.PointingHandCursor)
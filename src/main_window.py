@@ -1,5 +1,7 @@
-from PySide6.QtCore import Qt, QRect, Slot
-from PySide6.QtGui import QCursor, QAction
+from functools import lru_cache, partial
+
+from PySide6.QtCore import QRect, Slot
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (QWidget, QMainWindow,
     QMenuBar, QMenu, QStatusBar,
     QPushButton, QMessageBox,
@@ -9,8 +11,31 @@ from image import ChessImage
 from .chess_board import ChessBoard, ReverseBoardButton
 from .chess_piece import PieceType
 from .chess_clock import ChessClock
+from .cursor import getPointingCursor
+
+# Images are decoded once and shared by every window (QPixmap is implicitly shared)
+@lru_cache(maxsize=1)
+def _get_chess_image() -> ChessImage:
+    return ChessImage()
 
 class MainWindow(QMainWindow):
+    # Clock places : Upper (opponent side) / Lower (player side)
+    __UPPER_CLOCK_RECT = QRect(850,  50, 125, 50)
+    __LOWER_CLOCK_RECT = QRect(850, 800, 125, 50)
+
+    # New-game actions : (Object name, Text, Time limit in seconds), None for a separator
+    __NEW_GAME_SPECS = (
+        ("new_game_1_minutes",  "1 Minutes",  1 * 60),
+        ("new_game_3_minutes",  "3 Minutes",  3 * 60),
+        ("new_game_5_minutes",  "5 Minutes",  5 * 60),
+        None,
+        ("new_game_10_minutes", "10 Minutes", 10 * 60),
+        ("new_game_30_minutes", "30 Minutes", 30 * 60),
+        ("new_game_60_minutes", "60 Minutes", 60 * 60),
+        None,
+        ("new_game_unlimited",  "Unlimited",  None)
+    )
+
     def __init__(self):
         super().__init__()
         self.__load_resource()
@@ -52,42 +77,21 @@ class MainWindow(QMainWindow):
         self.__menu_new_game.setObjectName("new_game")
         self.__menu_new_game.setTitle("New Game")
 
-        # Actions
-        self.__action_new_1min = QAction(self)
-        self.__action_new_1min.setObjectName("new_game_1_minutes")
-        self.__action_new_1min.setText("1 Minutes")
-        self.__action_new_1min.triggered.connect(self.__new_game)
-
-        self.__action_new_3min = QAction(self)
-        self.__action_new_3min.setObjectName("new_game_3_minutes")
-        self.__action_new_3min.setText("3 Minutes")
-        self.__action_new_3min.triggered.connect(self.__new_game)
-
-        self.__action_new_5min = QAction(self)
-        self.__action_new_5min.setObjectName("new_game_5_minutes")
-        self.__action_new_5min.setText("5 Minutes")
-        self.__action_new_5min.triggered.connect(self.__new_game)
-        
-        self.__action_new_10min = QAction(self)
-        self.__action_new_10min.setObjectName("new_game_10_minutes")
-        self.__action_new_10min.setText("10 Minutes")
-        self.__action_new_10min.triggered.connect(self.__new_game)
-
-        self.__action_new_30min = QAction(self)
-        self.__action_new_30min.setObjectName("new_game_30_minutes")
-        self.__action_new_30min.setText("30 Minutes")
-        self.__action_new_30min.triggered.connect(self.__new_game)
-
-        self.__action_new_60min = QAction(self)
-        self.__action_new_60min.setObjectName("new_game_60_minutes")
-        self.__action_new_60min.setText("60 Minutes")
-        self.__action_new_60min.triggered.connect(self.__new_game)
-
-        self.__action_new_unlimit = QAction(self)
-        self.__action_new_unlimit.setObjectName("new_game_unlimited")
-        self.__action_new_unlimit.setText("Unlimited")
-        self.__action_new_unlimit.triggered.connect(self.__new_game)
+        # Menu contents (actions) are built when each menu is first shown
+        self.__menubar.addAction(self.__menu_menu.menuAction())
+        self.__menu_built = False
+        self.__menu_menu.aboutToShow.connect(self.__build_menu)
 
+        self.__new_game_menu_built = False
+        self.__menu_new_game.aboutToShow.connect(self.__build_new_game_menu)
+
+    @Slot()
+    def __build_menu(self):
+        if self.__menu_built == True:
+            return
+        self.__menu_built = True
+
+        # Actions
         self.__action_load = QAction(self)
         self.__action_load.setObjectName("load")
         self.__action_load.setText("Load")
@@ -99,24 +103,30 @@ class MainWindow(QMainWindow):
         self.__action_exit.triggered.connect(self.close)
 
         # Add actions into menu
-        self.__menubar.addAction(self.__menu_menu.menuAction())
-
         self.__menu_menu.addAction(self.__menu_new_game.menuAction())
         self.__menu_menu.addSeparator()
         self.__menu_menu.addAction(self.__action_load)
         self.__menu_menu.addSeparator()
         self.__menu_menu.addAction(self.__action_exit)
 
-        self.__menu_new_game.addAction(self.__action_new_1min)
-        self.__menu_new_game.addAction(self.__action_new_3min)
-        self.__menu_new_game.addAction(self.__action_new_5min)
-        self.__menu_new_game.addSeparator()
-        self.__menu_new_game.addAction(self.__action_new_10min)
-        self.__menu_new_game.addAction(self.__action_new_30min)
-        self.__menu_new_game.addAction(self.__action_new_60min)
-        self.__menu_new_game.addSeparator()
-        self.__menu_new_game.addAction(self.__action_new_unlimit)
-
+    @Slot()
+    def __build_new_game_menu(self):
+        if self.__new_game_menu_built == True:
+            return
+        self.__new_game_menu_built = True
+
+        for _spec in MainWindow.__NEW_GAME_SPECS:
+            if _spec == None:
+                self.__menu_new_game.addSeparator()
+                continue
+
+            _objname, _text, _time_limit = _spec
+            _action = QAction(self)
+            _action.setObjectName(_objname)
+            _action.setText(_text)
+            _action.triggered.connect(partial(self.__new_game, _time_limit))
+            self.__menu_new_game.addAction(_action)
+    
     def __init_status_bar(self):
         self.__status_bar = QStatusBar(self)
         self.__status_bar.setObjectName("status_bar")
@@ -134,10 +144,16 @@ class MainWindow(QMainWindow):
         self.black_clock = ChessClock(600, 0, self)
         
         self.white_clock.setObjectName("white_clock")
-        self.white_clock.setGeometry(QRect(850, 800, 125, 50))
+        self.white_clock.setGeometry(MainWindow.__LOWER_CLOCK_RECT)
         
         self.black_clock.setObjectName("black_clock")
-        self.black_clock.setGeometry(QRect(850, 50, 125, 50))
+        self.black_clock.setGeometry(MainWindow.__UPPER_CLOCK_RECT)
+
+        # Turn -> (Pause clock of the side who just moved, Resume clock of the side to move)
+        self.__clock_switch = {
+            PieceType.WHITE : (self.black_clock.pauseClock, self.white_clock.resumeClock),
+            PieceType.BLACK : (self.white_clock.pauseClock, self.black_clock.resumeClock)
+        }
 
         # Resign & Tie Buttons
         self.start_button  = QPushButton("Start", self) 
@@ -157,14 +173,12 @@ class MainWindow(QMainWindow):
         # Reverse Board Buttons
         self.reverse_board_button = ReverseBoardButton(self.__resource, self)
         self.reverse_board_button.setGeometry(QRect(850, 125, 25, 25))
-        self.reverse_board_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.reverse_board_button.setCursor(getPointingCursor())
 
         self.__reversed = False
 
-        # Pop-up window
-        self.pop_up_window = QMessageBox()
-        self.pop_up_window.setIcon(QMessageBox.Icon.Information)
-        self.pop_up_window.setStandardButtons(QMessageBox.StandardButton.Ok)
+        # Pop-up window : Created on first use (see 'pop_up_window')
+        self.__pop_up_window = None
 
     def __connect_signal_and_slot(self):
         self.chess_board.turnChanged.connect(self.__turn_change_handler)
@@ -180,42 +194,30 @@ class MainWindow(QMainWindow):
         self.reverse_board_button.buttonPressed.connect(self.__reverse_board_handler)
 
     def __load_resource(self):
-        self.__resource = ChessImage()
+        self.__resource = _get_chess_image()
     
-    @Slot()
-    def __new_game(self):
+    # Time limit is bound per action (None : Unlimited); 'checked' of QAction.triggered is unused
+    def __new_game(self, time_limit : int | None, checked : bool = False):
         # Reset chess board
         self.__turn = PieceType.WHITE
         self.__reversed = False
         self.chess_board.resetChessBoard()
 
-        match self.sender():
-            case self.__action_new_1min:
-                __time_limit = 1 * 60
-            case self.__action_new_3min:
-                __time_limit = 3 * 60
-            case self.__action_new_5min:
-                __time_limit = 5 * 60
-            case self.__action_new_10min:
-                __time_limit = 10 * 60
-            case self.__action_new_30min:
-                __time_limit = 30 * 60
-            case self.__action_new_60min:
-                __time_limit = 60 * 60
-        
-        if self.sender() != self.__action_new_unlimit:
-            self.white_clock.setTimer(__time_limit)
-            self.black_clock.setTimer(__time_limit)
+        if time_limit != None:
+            self.white_clock.setTimer(time_limit)
+            self.black_clock.setTimer(time_limit)
         else:
             self.white_clock.setUnlimited()
             self.black_clock.setUnlimited()
         
         self.start_button.setVisible(True)
 
+    @Slot()
     def __loadChessRecord(self):
         # Unimplemented
         pass
     
+    @Slot()
     def __start_game(self):
         # Unfreeze chess board
         self.chess_board.unfreezeChessBoard()
@@ -240,6 +242,7 @@ class MainWindow(QMainWindow):
         # Activate start button
         self.start_button.setVisible(True)
 
+    @Slot()
     def __resign_handler(self):
         # Freeze chess board
         self.chess_board.freezeChessBoard()
@@ -258,6 +261,7 @@ class MainWindow(QMainWindow):
         # Reset game
         self.__reset_game()
 
+    @Slot()
     def __tie_handler(self):
         # Freeze chess board
         self.chess_board.freezeChessBoard()
@@ -272,35 +276,29 @@ class MainWindow(QMainWindow):
         # Reset game
         self.__reset_game()
 
-    @Slot()
-    def __turn_change_handler(self):
+    @Slot(int)
+    def __turn_change_handler(self, turn : int):
         # Change player turn
-        self.__turn = PieceType.BLACK if self.__turn == PieceType.WHITE else PieceType.WHITE
+        self.__turn = turn
 
         # Handle clock
-        if self.__turn == PieceType.WHITE:
-            self.black_clock.pauseClock()
-            self.white_clock.resumeClock()
-        else:
-            self.white_clock.pauseClock()
-            self.black_clock.resumeClock()
+        _pause_clock, _resume_clock = self.__clock_switch[turn]
+        _pause_clock()
+        _resume_clock()
 
+    @Slot()
     def __reverse_board_handler(self):
         self.__reversed = not self.__reversed
 
-        _upper_clock_rect = QRect(850, 50, 125, 50)
-        _lower_clock_rect = QRect(850, 800, 125, 50)
-
-        if self.__reversed == False:
-            self.white_clock.setGeometry(_lower_clock_rect)
-            self.black_clock.setGeometry(_upper_clock_rect)
-        else:
-            self.white_clock.setGeometry(_upper_clock_rect)
-            self.black_clock.setGeometry(_lower_clock_rect)
+        _white_rect, _black_rect = (MainWindow.__UPPER_CLOCK_RECT, MainWindow.__LOWER_CLOCK_RECT) if self.__reversed \
+                              else (MainWindow.__LOWER_CLOCK_RECT, MainWindow.__UPPER_CLOCK_RECT)
+        self.white_clock.setGeometry(_white_rect)
+        self.black_clock.setGeometry(_black_rect)
 
         # Change place of all active pieces in chess board
         self.chess_board.reverseChessBoard()
     
+    @Slot(int)
     def __game_over_win_handler(self, winner : PieceType):
         # Freeze chess board
         self.chess_board.freezeChessBoard()
@@ -330,6 +328,7 @@ class MainWindow(QMainWindow):
         # Reset game
         self.__reset_game()
 
+    @Slot()
     def __game_over_tie_handler(self):
         # Freeze chess board
         self.chess_board.freezeChessBoard()
@@ -346,6 +345,7 @@ class MainWindow(QMainWindow):
         # Reset game
         self.__reset_game()
 
+    @Slot()
     def __timeout_handler(self):
         # Freeze chess board
         self.chess_board.freezeChessBoard()
@@ -377,6 +377,14 @@ class MainWindow(QMainWindow):
         # Reset game
         self.__reset_game()
     
+    @property
+    def pop_up_window(self) -> QMessageBox:
+        if self.__pop_up_window == None:
+            self.__pop_up_window = QMessageBox()
+            self.__pop_up_window.setIcon(QMessageBox.Icon.Information)
+            self.__pop_up_window.setStandardButtons(QMessageBox.StandardButton.Ok)
+        return self.__pop_up_window
+
     def __show_pop_up_window(self, title : str, text : str):
         self.pop_up_window.setWindowTitle(title)
         self.pop_up_window.setText(text)
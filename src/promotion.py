@@ -1,80 +1,60 @@
-import os
-
-from PySide6.QtCore import Qt, QObject
-from PySide6.QtGui import QCursor
+from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QGraphicsItemGroup, QGraphicsPixmapItem
 
 from image import ChessImage
 from .chess_piece import PieceType
+from .cursor import getPointingCursor
 
 class PromotionItem(QGraphicsItemGroup):
     VERTICAL   = 0
     HORIZONTAL = 1
 
+    # Orientation -> Background pixmap attribute of ChessImage
+    __BACKGROUND_ATTR = { VERTICAL : 'promotion_bg_ver', HORIZONTAL : 'promotion_bg_hor' }
+
+    # Color -> Pixmap attributes of choices (queen, rook, bishop, knight)
+    __CHOICE_ATTR = {
+        PieceType.WHITE : ('white_queen', 'white_rook', 'white_bishop', 'white_knight'),
+        PieceType.BLACK : ('black_queen', 'black_rook', 'black_bishop', 'black_knight')
+    }
+
+    # Orientation -> Positions of choices (queen, rook, bishop, knight)
+    __CHOICE_POS = {
+        VERTICAL   : ((0, 0), (0, 100), (0, 200), (0, 300)),
+        HORIZONTAL : ((0, 0), (100, 0), (200, 0), (300, 0))
+    }
+
     def __init__(self, orientation : int,
                        color : PieceType,
                        resource : ChessImage,
                        parent : QObject | None = None):
+        # Argument check (stripped under 'python -O')
+        if __debug__:
+            if orientation not in PromotionItem.__BACKGROUND_ATTR:
+                raise ValueError(f'PromotionItem : Invalid orientation {orientation!r}')
+            if color not in PromotionItem.__CHOICE_ATTR:
+                raise ValueError(f'PromotionItem : Invalid color {color!r}')
         super().__init__(parent)
 
         self.item_background = QGraphicsPixmapItem(self)
         self.orient = orientation
-        if orientation == PromotionItem.VERTICAL:
-            self.item_background.setPixmap(resource.promotion_bg_ver)
-        elif orientation == PromotionItem.HORIZONTAL:
-            self.item_background.setPixmap(resource.promotion_bg_hor)
-        else:
-            # Invalid orientation
-            print('PromotionItem.__init__() :')
-            print('Error : Invalid argument for \'orientation\'')
-            exit()
+        self.item_background.setPixmap(getattr(resource, PromotionItem.__BACKGROUND_ATTR[orientation]))
         
         # Set some properties
         self.setVisible(False) # Deactivate
         self.setPos(300, 0)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setCursor(getPointingCursor())
 
         # Generate item for choosing piece to promote
+        # (Created after the background, so they stack above it without explicit Z-values)
         self.item_choice_queen  = QGraphicsPixmapItem(self)
         self.item_choice_rook   = QGraphicsPixmapItem(self)
         self.item_choice_bishop = QGraphicsPixmapItem(self)
         self.item_choice_knight = QGraphicsPixmapItem(self)
 
-        # Set color
+        # Set color and place each piece in proper position
         self.color = color
-        if self.color == PieceType.WHITE:
-            self.item_choice_queen .setPixmap(resource.white_queen)
-            self.item_choice_rook  .setPixmap(resource.white_rook)
-            self.item_choice_bishop.setPixmap(resource.white_bishop)
-            self.item_choice_knight.setPixmap(resource.white_knight)
-        elif self.color == PieceType.BLACK:
-            self.item_choice_queen .setPixmap(resource.black_queen)
-            self.item_choice_rook  .setPixmap(resource.black_rook)
-            self.item_choice_bishop.setPixmap(resource.black_bishop)
-            self.item_choice_knight.setPixmap(resource.black_knight)
-        else:
-            # Invalid color
-            print('PromotionItem.__init__() :')
-            print('Error : Invalid argument for \'color\'')
-            exit()
-        
-        # Place each piece in proper position
-        if orientation == PromotionItem.VERTICAL:
-            self.item_choice_queen .setPos(0, 0)
-            self.item_choice_rook  .setPos(0, 100)
-            self.item_choice_bishop.setPos(0, 200)
-            self.item_choice_knight.setPos(0, 300)
-        elif orientation == PromotionItem.HORIZONTAL:
-            self.item_choice_queen .setPos(0, 0)
-            self.item_choice_rook  .setPos(100, 0)
-            self.item_choice_bishop.setPos(200, 0)
-            self.item_choice_knight.setPos(300, 0)
-
-        # Set Z-value
-        self.item_background.setZValue(1)
-        self.item_choice_queen.setZValue(2)
-        self.item_choice_rook.setZValue(2)
-        self.item_choice_bishop.setZValue(2)
-        self.item_choice_knight.setZValue(2)
-    
-    
\ No newline at end of file
+        _choices = (self.item_choice_queen, self.item_choice_rook, self.item_choice_bishop, self.item_choice_knight)
+        for _item, _attr, (_x, _y) in zip(_choices, PromotionItem.__CHOICE_ATTR[color], PromotionItem.__CHOICE_POS[orientation]):
+            _item.setPixmap(getattr(resource, _attr))
+            _item.setPos(_x, _y)